@@ -3,22 +3,40 @@
 from __future__ import print_function
 
 import argparse
-import json
-import re
-import subprocess
+import hashlib
 import sys
 
+from collections import OrderedDict
+
 from pycoin.encoding.hexbytes import b2h, h2b
 from pycoin.ui.key_from_text import key_info_from_text
 from pycoin.networks.default import get_current_netcode
 from pycoin.networks.registry import network_codes, network_for_netcode
 
+try:
+    import secrets
+except ImportError:
+    # python 2
+    secrets = None
+
+
+DECIMAL_DIGITS = frozenset("0123456789")
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
 
-SEC_RE = re.compile(r"^(0[23][0-9a-fA-F]{64})|(04[0-9a-fA-F]{128})$")
-HASH160_RE = re.compile(r"^([0-9a-fA-F]{40})$")
+def parse_as_hash160(s):
+    if len(s) == 40 and HEX_DIGITS.issuperset(s):
+        return h2b(s)
+
+
+def parse_as_sec(s):
+    if (len(s) == 66 and s[:2] in ("02", "03")) or (len(s) == 130 and s[:2] == "04"):
+        if HEX_DIGITS.issuperset(s):
+            return h2b(s)
 
 
 def gpg_entropy():
+    import subprocess
     try:
         output = subprocess.Popen(
             ["gpg", "--gen-random", "2", "64"], stdout=subprocess.PIPE).communicate()[0]
@@ -30,12 +48,17 @@ def gpg_entropy():
 
 def get_entropy():
     entropy = bytearray()
+    if secrets:
+        # the OS CSPRNG is as good as gpg and doesn't need a fork/exec
+        entropy.extend(secrets.token_bytes(64))
+    else:
+        try:
+            entropy.extend(gpg_entropy())
+        except Exception:
+            print("warning: can't use gpg as entropy source", file=sys.stdout)
     try:
-        entropy.extend(gpg_entropy())
-    except Exception:
-        print("warning: can't use gpg as entropy source", file=sys.stdout)
-    try:
-        entropy.extend(open("/dev/random", "rb").read(64))
+        with open("/dev/random", "rb") as f:
+            entropy.extend(f.read(64))
     except Exception:
         print("warning: can't use /dev/random as entropy source", file=sys.stdout)
     entropy = bytes(entropy)
@@ -45,14 +68,21 @@ def get_entropy():
 
 
 def parse_as_number(s):
-    try:
-        return int(s)
-    except ValueError:
-        pass
-    try:
-        return int(s, 16)
-    except ValueError:
-        pass
+    s = s.strip()
+    # int() also accepts "_" between digits (as in 1_000 or 0x_ff)
+    digits = (s[1:] if s[:1] in ("-", "+") else s).replace("_", "")
+    if digits[:2] in ("0x", "0X"):
+        base, digits = 16, digits[2:]
+    elif DECIMAL_DIGITS.issuperset(digits):
+        base = 10
+    else:
+        base = 16
+    if digits and HEX_DIGITS.issuperset(digits):
+        try:
+            return int(s, base)
+        except ValueError:
+            # misplaced "_"
+            pass
 
 
 def parse_as_secret_exponent(s, generator):
@@ -79,10 +109,9 @@ def parse_as_public_pair(s, generator):
 
 
 def create_output(item, key, network, output_key_set, subkey_path=None):
-    ui_context = network.ui
-    key._ui_context = ui_context
-    output_dict = {}
-    output_order = []
+    # json_key => (human_readable_key, value); legacy keys have no human readable form
+    output_dict = OrderedDict()
+    missing_keys = set(output_key_set)
 
     def add_output(json_key, value=None, human_readable_key=None):
         if output_key_set and json_key not in output_key_set:
@@ -90,60 +119,81 @@ def create_output(item, key, network, output_key_set, subkey_path=None):
         if human_readable_key is None:
             human_readable_key = json_key.replace("_", " ")
         if value:
+            missing_keys.discard(json_key)
             if human_readable_key == "legacy":
-                output_dict[json_key.strip()] = value
+                output_dict[json_key.strip()] = (None, value)
             else:
-                output_dict[json_key.strip().lower()] = value
-                output_order.append((json_key.lower(), human_readable_key))
-
-    full_network_name = "%s %s" % (network.network_name, network.subnet_name)
-    add_output("input", item)
-    add_output("network", full_network_name)
-    add_output("symbol", network.symbol)
-
-    if hasattr(key, "hwif"):
-        if subkey_path:
-            add_output("subkey_path", subkey_path)
-        for k, v, text in network.output_for_hwif(key.serialize(), network, subkey_path, add_output):
-            add_output(k, v, text)
-
-    secret_exponent = key.secret_exponent()
-    if secret_exponent:
-        for k, v, text in network.output_for_secret_exponent(secret_exponent):
-            add_output(k, v, text)
-
-    public_pair = key.public_pair()
-    if public_pair:
-        for k, v, text in network.output_for_public_pair(public_pair):
-            add_output(k, v, text)
-    else:
-        for k, v, text in network.output_for_h160(key.hash160()):
-            add_output(k, v, text)
-
-    return output_dict, output_order
-
-
-def dump_output(output_dict, output_order):
-    print('')
-    max_length = max(len(v[1]) for v in output_order)
-    for key, hr_key in output_order:
-        space_padding = ' ' * (1 + max_length - len(hr_key))
-        val = output_dict.get(key)
-        if val is None:
-            print(hr_key)
+                output_dict[json_key.strip().lower()] = (human_readable_key, value)
+
+    def all_outputs():
+        full_network_name = "%s %s" % (network.network_name, network.subnet_name)
+        yield ("input", item, None)
+        yield ("network", full_network_name, None)
+        yield ("symbol", network.symbol, None)
+
+        if hasattr(key, "hwif"):
+            if subkey_path:
+                yield ("subkey_path", subkey_path, None)
+            for _ in network.output_for_hwif(key.serialize(), network, subkey_path, add_output):
+                yield _
+
+        secret_exponent = key.secret_exponent()
+        if secret_exponent:
+            for _ in network.output_for_secret_exponent(secret_exponent):
+                yield _
+
+        public_pair = key.public_pair()
+        if public_pair:
+            for _ in network.output_for_public_pair(public_pair):
+                yield _
         else:
-            if len(val) > 80:
-                val = "%s\\\n%s%s" % (val[:66], ' ' * (5 + max_length), val[66:])
-            print("%s%s: %s" % (hr_key, space_padding, val))
+            for _ in network.output_for_h160(key.hash160()):
+                yield _
+
+    # the outputs are generated lazily, so once every requested key has been
+    # seen we can skip the rest (which may involve expensive point math)
+    for k, v, text in all_outputs():
+        add_output(k, v, text)
+        if output_key_set and not missing_keys:
+            break
+
+    return output_dict
+
+
+def dump_output(output_dict):
+    rows = [v for v in output_dict.values() if v[0] is not None]
+    max_length = max(len(hr_key) for hr_key, val in rows)
+    lines = ['']
+    for hr_key, val in rows:
+        if len(val) > 80:
+            val = "%s\\\n%s%s" % (val[:66], ' ' * (5 + max_length), val[66:])
+        lines.append("%s: %s" % (hr_key.ljust(max_length + 1), val))
+    print('\n'.join(lines))
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """
+    Listing the known networks means importing every one of them, so only do
+    it when help text is actually shown.
+    """
+    def format_help(self):
+        if self.epilog is None:
+            self.epilog = ('Known networks codes:\n  ' +
+                           ', '.join(['%s (%s)' % (i, network_for_netcode(i).full_name()) for i in network_codes()]))
+        return super(_ArgumentParser, self).format_help()
+
+
+def _netcode_arg(s):
+    try:
+        return network_for_netcode(s).symbol
+    except ValueError:
+        raise argparse.ArgumentTypeError("unknown network code %s (see --help for known codes)" % s)
 
 
 def create_parser():
-    codes = network_codes()
-    parser = argparse.ArgumentParser(
+    parser = _ArgumentParser(
         description='Crypto coin utility ku ("key utility") to show'
-        ' information about Bitcoin or other cryptocoin data structures.',
-        epilog=('Known networks codes:\n  ' +
-                ', '.join(['%s (%s)' % (i, network_for_netcode(i).full_name()) for i in codes]))
+        ' information about Bitcoin or other cryptocoin data structures.'
     )
     parser.add_argument('-w', "--wallet", help='show just Bitcoin wallet key', action='store_true')
     parser.add_argument('-W', "--wif", help='show just Bitcoin WIF', action='store_true')
@@ -158,9 +208,9 @@ def create_parser():
     parser.add_argument('-b', "--brief", nargs="*", help='brief output; display a single field')
 
     parser.add_argument('-s', "--subkey", help='subkey path (example: 0H/2/15-20)', default="")
-    parser.add_argument('-n', "--network", help='specify network', choices=codes)
+    parser.add_argument('-n', "--network", help='specify network', type=_netcode_arg)
     parser.add_argument(
-        "--override-network", help='override detected network type', default=None, choices=codes)
+        "--override-network", help='override detected network type', default=None, type=_netcode_arg)
 
     parser.add_argument(
         'item', nargs="*", help='a BIP0032 wallet key string;'
@@ -180,11 +230,14 @@ def create_parser():
 
 def _create_bip32(network):
     max_retries = 64
+    master_secret = get_entropy()
     for _ in range(max_retries):
         try:
-            return network.extras.BIP32Node.from_master_secret(get_entropy())
-        except ValueError as e:
-            continue
+            return network.extras.BIP32Node.from_master_secret(master_secret)
+        except ValueError:
+            # an out-of-range secret exponent; rehash rather than gathering
+            # fresh entropy (and spawning gpg) all over again
+            master_secret = hashlib.sha512(master_secret).digest()
     # Probably a bug if we get here
     raise RuntimeError("can't create BIP32 key")
 
@@ -196,18 +249,22 @@ def parse_key(item, networks):
     if item == 'create':
         return None, _create_bip32(default_network)
 
+    # 40 hex characters can only pass as base58 if the checksum matches by
+    # chance, so check for a hash160 before trying every network's parsers
+    hash160 = parse_as_hash160(item)
+    if hash160:
+        return None, Key(hash160=hash160)
+
     for network, key_info in key_info_from_text(item, networks=networks):
         return network, key_info["create_f"]()
 
-    if HASH160_RE.match(item):
-        return None, Key(hash160=h2b(item))
-
     secret_exponent = parse_as_secret_exponent(item, generator)
     if secret_exponent:
         return None, Key(secret_exponent=secret_exponent)
 
-    if SEC_RE.match(item):
-        return None, Key.from_sec(h2b(item))
+    sec = parse_as_sec(item)
+    if sec:
+        return None, Key.from_sec(sec)
 
     public_pair = parse_as_public_pair(item, generator)
     if public_pair:
@@ -216,26 +273,30 @@ def parse_key(item, networks):
     return None, None
 
 
-def generate_output(args, output_dict, output_order):
+def generate_output(args, output_dict):
     if args.json:
+        import json
+        json_dict = dict((k, v) for k, (hr_key, v) in output_dict.items())
         # the python2 version of json.dumps puts an extra blank prior to the end of each line
         # the "replace" is a hack to make python2 produce the same output as python3
-        print(json.dumps(output_dict, indent=3, sort_keys=True).replace(" \n", "\n"))
+        print(json.dumps(json_dict, indent=3, sort_keys=True).replace(" \n", "\n"))
         return
 
-    if len(output_order) == 0:
+    values = [v for hr_key, v in output_dict.values() if hr_key is not None]
+    if len(values) == 0:
         print("no output: use -j option to see keys")
     elif len(output_dict) == 1:
-        print(output_dict[output_order[0][0]])
+        print(values[0])
     else:
-        dump_output(output_dict, output_order)
+        dump_output(output_dict)
 
 
 def ku(args, parser):
     fallback_network = network_for_netcode(args.network or get_current_netcode())
-    parse_networks = [fallback_network] + [network_for_netcode(netcode) for netcode in network_codes()]
     if args.network:
-        parse_networks = [network_for_netcode(args.network)]
+        parse_networks = [fallback_network]
+    else:
+        parse_networks = [fallback_network] + [network_for_netcode(netcode) for netcode in network_codes()]
 
     override_network = None
     if args.override_network:
@@ -244,7 +305,9 @@ def ku(args, parser):
         override_network = network_for_netcode(args.override_network)
 
     def parse_stdin():
-        return [item for item in sys.stdin.readline().strip().split(' ') if len(item) > 0]
+        for line in sys.stdin:
+            for item in line.split():
+                yield item
 
     output_key_set = set(args.brief or [])
     if args.wallet:
@@ -268,9 +331,9 @@ def ku(args, parser):
             if args.public:
                 key = key.public_copy()
 
-            output_dict, output_order = create_output(item, key, display_network, output_key_set)
+            output_dict = create_output(item, key, display_network, output_key_set)
 
-            generate_output(args, output_dict, output_order)
+            generate_output(args, output_dict)
 
 
 def main():
@@ -22,15 +22,12 @@ class Generator(Curve, Point):
         """
         Curve.__init__(self, p, a, b, order)
         Point.__init__(self, basis[0], basis[1], self)
-        self._powers = []
-        Gp = self
-        for _ in range(256):
-            self._powers.append(Gp)
-            Gp += Gp
+        self._window_table = None
+        self._minus_window_offset = None
         assert p % 4 == 3, "p % 4 must be 3 due to modular_sqrt optimization"
         self._mod_sqrt_power = (p + 1) // 4
         self._blinding_factor = from_bytes(entropy_f(32)) % self._order
-        self._minus_blinding_factor_g = self.raw_mul(-self._blinding_factor)
+        self._minus_blinding_factor_g = None
 
     def modular_sqrt(self, a):
         "Return n where n * n == a (mod p). If no such n exists, an arbitrary value will be returned."
@@ -84,20 +81,45 @@ class Generator(Curve, Point):
         except ValueError:
             return []
 
+    def _make_window_table(self):
+        """
+        Precompute j * 16**i * G + G for every 4-bit window i and digit j, so raw_mul
+        needs one addition per window rather than one per bit. The extra G keeps
+        every entry (even for a zero digit) a real point, so each addition does the
+        same work; raw_mul subtracts the accumulated 64 * G at the end.
+        """
+        table = []
+        Gp = self
+        for _ in range(64):
+            row = [self]
+            for _ in range(15):
+                row.append(row[-1] + Gp)
+            table.append(row)
+            for _ in range(4):
+                Gp += Gp
+        offset = self
+        for _ in range(6):
+            offset += offset
+        return table, -offset
+
     def raw_mul(self, e):
         """Multiply the generator by an integer."""
+        if self._window_table is None:
+            # built on first use, since native optimizations replace raw_mul entirely
+            self._window_table, self._minus_window_offset = self._make_window_table()
         e %= self._order
-        P = self._infinity
-        for bit in range(256):
-            # add the power of the generator every time to make it more time-deterministic
-            a = [P, P + self._powers[bit]]
-            # choose the correct result
-            P = a[e & 1]
-            e >>= 1
-        return P
+        table = self._window_table
+        P = table[0][e & 15]
+        for row in table[1:]:
+            e >>= 4
+            # add an entry for every window to make it more time-deterministic
+            P += row[e & 15]
+        return P + self._minus_window_offset
 
     def __mul__(self, e):
         """Multiply the generator by an integer. Uses the blinding factor."""
+        if self._minus_blinding_factor_g is None:
+            self._minus_blinding_factor_g = self.raw_mul(-self._blinding_factor)
         return self.raw_mul(e + self._blinding_factor) + self._minus_blinding_factor_g
 
     def __rmul__(self, e):
@@ -37,6 +37,9 @@ class BIP32Node(Key):
     https://en.bitcoin.it/wiki/BIP_0032
     """
 
+    __slots__ = ("_secret_exponent_bytes", "_chain_code", "_depth", "_parent_fingerprint",
+                 "_child_index", "_subkey_cache")
+
     @classmethod
     def from_master_secret(class_, master_secret, generator=None):
         """Generate a Wallet from a master password."""
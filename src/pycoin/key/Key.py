@@ -18,6 +18,9 @@ class InvalidSecretExponentError(ValueError):
 
 class Key(object):
 
+    __slots__ = ("_prefer_uncompressed", "_secret_exponent", "_generator", "_public_pair",
+                 "_hash160_uncompressed", "_hash160_compressed", "_hash160")
+
     _ui_context = None
     _default_generator = None
 
@@ -25,6 +28,7 @@ class Key(object):
     def make_subclass(class_, ui_context, generator):
 
         class Key(class_):
+            __slots__ = ()
             _ui_context = ui_context
             _default_generator = generator
 
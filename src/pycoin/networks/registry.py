@@ -12,8 +12,18 @@ def search_prefixes():
     return prefixes
 
 
+_NETWORK_CACHE = {}
+
+
 def network_for_netcode(symbol):
     symbol = symbol.upper()
+    network = _NETWORK_CACHE.get(symbol)
+    if network is None:
+        network = _NETWORK_CACHE[symbol] = _load_network(symbol)
+    return network
+
+
+def _load_network(symbol):
     netcode = symbol.lower()
     for prefix in search_prefixes():
         try:
@@ -22,18 +22,22 @@ class BIP32Parser(Parser):
         return self.info_for_data(data, is_private=False)
 
     def info_for_data(self, data, is_private):
+        deserialize = self._bip32node_class.deserialize
         return dict(type="key", key_type="bip32", bip32_type="plain", is_private=is_private,
-                    key_class=self._bip32node_class, create_f=lambda: self._bip32node_class.deserialize(data=data))
+                    key_class=self._bip32node_class, create_f=lambda: deserialize(data=data))
 
     def info_for_H(self, prefix, data):
+        # decode eagerly: a ValueError here is what tells the caller this isn't a valid H: key
         bin_data = h2b(data)
         kwargs = dict(generator=self._generator, master_secret=bin_data)
+        from_master_secret = self._bip32node_class.from_master_secret
         return dict(type="key", key_type="bip32", bip32_type="seeded", is_private=True, key_class=self._bip32node_class,
-                    seed_type="hex", create_f=lambda: self._bip32node_class.from_master_secret(**kwargs),
+                    seed_type="hex", create_f=lambda: from_master_secret(**kwargs),
                     kwargs=kwargs)
 
     def info_for_P(self, prefix, data):
         kwargs = dict(generator=self._generator, master_secret=data.encode("utf8"))
+        from_master_secret = self._bip32node_class.from_master_secret
         return dict(type="key", key_type="bip32", bip32_type="seeded", is_private=True, key_class=self._bip32node_class,
-                    seed_type="text", create_f=lambda: self._bip32node_class.from_master_secret(**kwargs),
+                    seed_type="text", create_f=lambda: from_master_secret(**kwargs),
                     kwargs=kwargs)
@@ -91,6 +91,18 @@ class Parser(object):
     _bech32_prefixes = defaultdict(list)
     _colon_prefixes = defaultdict(list)
 
+    def dispatch_keys(self):
+        """
+        Yield (metadata_key, prefix) for every prefix this parser might accept.
+        """
+        for size, lookup in self._base58_prefixes.items():
+            for prefix in lookup:
+                yield ("as_base58", prefix)
+        for hrp in self._bech32_prefixes:
+            yield ("as_bech32", hrp)
+        for prefix in self._colon_prefixes:
+            yield ("as_colon", prefix)
+
     def _parse_as_base58(self, data):
         for size, lookup in self._base58_prefixes.items():
             prefix = data[:size]
@@ -1,10 +1,53 @@
+from collections import defaultdict
+
 from pycoin.ui.Parser import metadata_for_text
 
 
+KEY_TYPES = ["key", "bip32", "electrum"]
+
+_DISPATCH_TABLES = {}
+
+
+def _dispatch_table(networks):
+    """
+    Return a dict mapping each (metadata_key, prefix) a key parser accepts to the
+    networks that accept it (in order), and the set of base58 prefix sizes in use.
+    """
+    r = _DISPATCH_TABLES.get(networks)
+    if r is None:
+        table = defaultdict(list)
+        for network in networks:
+            for k in set(network.ui.dispatch_keys_for_types(KEY_TYPES)):
+                table[k].append(network)
+        base58_sizes = set(len(prefix) for key, prefix in table if key == "as_base58")
+        r = _DISPATCH_TABLES[networks] = (dict(table), base58_sizes)
+    return r
+
+
+def _dispatch_keys_for_metadata(metadata, base58_sizes):
+    if metadata.get("as_base58"):
+        data = metadata["as_base58"][0]
+        for size in base58_sizes:
+            yield ("as_base58", data[:size])
+    if metadata.get("as_bech32"):
+        yield ("as_bech32", metadata["as_bech32"][0])
+    if metadata.get("as_colon"):
+        yield ("as_colon", metadata["as_colon"][0])
+
+
 def key_info_from_text(text, networks):
     metadata = metadata_for_text(text)
-    for network in networks:
-        info = network.ui.parse_to_info(metadata, types=["key", "bip32", "electrum"])
+    networks = tuple(networks)
+    table, base58_sizes = _dispatch_table(networks)
+    # only networks with a parser for one of the text's prefixes can match
+    matches = [table[k] for k in _dispatch_keys_for_metadata(metadata, base58_sizes) if k in table]
+    if len(matches) == 1:
+        candidates = matches[0]
+    else:
+        matched = set(n for m in matches for n in m)
+        candidates = [n for n in networks if n in matched]
+    for network in candidates:
+        info = network.ui.parse_to_info(metadata, types=KEY_TYPES)
         if info:
             yield network, info
 
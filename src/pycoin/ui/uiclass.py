@@ -126,6 +126,11 @@ class UI(object):
             return [p for p in self._parsers if p.TYPE in types]
         return self._parsers
 
+    def dispatch_keys_for_types(self, types):
+        for p in self.parsers_for_types(types):
+            for k in p.dispatch_keys():
+                yield k
+
     def parse_to_info(self, metadata, types):
         return parse_to_info(metadata, self.parsers_for_types(types))
 
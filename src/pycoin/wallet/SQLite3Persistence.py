@@ -2,6 +2,11 @@ from pycoin.encoding.hexbytes import b2h, h2b, b2h_rev, h2b_rev
 from pycoin.key.BIP32Node import BIP32Node
 
 
+class PersistedBIP32Node(BIP32Node):
+    """A BIP32Node that also carries its BIP32Key row id."""
+    __slots__ = ("id",)
+
+
 class SQLite3Persistence(object):
     def __init__(self, sqlite3_db):
         self.db = sqlite3_db
@@ -42,7 +47,7 @@ as_text text not null
         r = c.fetchone()
         if r is None:
             return None
-        bip32_node = BIP32Node.from_hwif(r[1])
+        bip32_node = PersistedBIP32Node.from_hwif(r[1])
         bip32_node.id = r[0]
         return bip32_node
 